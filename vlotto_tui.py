@@ -1,15 +1,44 @@
 #!/usr/bin/env python3
 
  
+import asyncio
+import bisect
+import functools
 import json
 import os
 import getpass
+import math
+import re
 import time
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
-from requests.exceptions import ConnectionError, Timeout, RequestException
+import aiohttp
+
+try:
+    import zmq
+    import zmq.asyncio
+except ImportError:
+    zmq = None  # ZMQ notifications are optional; we fall back to polling
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional; stdlib json works, orjson is just faster
+
+# getoffers responses can run to megabytes on a busy marketplace, where the
+# native orjson decoder is several times faster than stdlib json.
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 
 DEFAULT_RPC_URL = "http://127.0.0.1:27486/"
@@ -20,19 +49,61 @@ DEFAULT_CONF_PATHS = [
     os.path.expanduser("~/.komodo/VRSC/VRSC.conf"),
     # macOS
     os.path.expanduser("~/Library/Application Support/Komodo/VRSC/VRSC.conf"),
-    # Windows (via APPDATA)
-    os.path.join(os.environ.get("APPDATA", ""), "Komodo", "VRSC", "VRSC.conf"),
 ]
+# Windows (via APPDATA) - only worth stat'ing when the variable is set
+if os.environ.get("APPDATA"):
+    DEFAULT_CONF_PATHS.append(os.path.join(os.environ["APPDATA"], "Komodo", "VRSC", "VRSC.conf"))
+
+# Parsed credentials are cached on disk keyed by the conf file's mtime, so
+# repeat launches skip the parse entirely, and memoized in-process for the
+# "Buy more tickets?" restart path.
+CRED_CACHE_PATH = os.path.expanduser("~/.cache/vlotto/rpc.json")
+_cred_memo: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None
+
+
+def _read_cred_cache(conf_path: str, mtime: float) -> Optional[Tuple[str, str, str]]:
+    try:
+        with open(CRED_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("conf") == conf_path and cached.get("mtime") == mtime:
+            return cached.get("user"), cached.get("pass"), cached.get("url")
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_cred_cache(conf_path: str, mtime: float, user: str, password: str, url: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(CRED_CACHE_PATH), exist_ok=True)
+        # The cache holds the RPC password, so create it 0600 from the start
+        # rather than chmod'ing after the fact
+        fd = os.open(CRED_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"conf": conf_path, "mtime": mtime, "user": user, "pass": password, "url": url}, f)
+    except OSError:
+        pass
 
 
 def load_rpc_credentials_from_conf() -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    global _cred_memo
+    if _cred_memo is not None:
+        return _cred_memo
+
     rpcuser = None
     rpcpassword = None
     rpcport = None
 
     for path in DEFAULT_CONF_PATHS:
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)  # one syscall covers both existence and mtime
+        except OSError:
             continue
+
+        cached = _read_cred_cache(path, st.st_mtime)
+        if cached:
+            _cred_memo = cached
+            return cached
+
         try:
             with open(path, "r", encoding="utf-8") as f:
                 for raw in f:
@@ -49,7 +120,12 @@ def load_rpc_credentials_from_conf() -> Tuple[Optional[str], Optional[str], Opti
             continue
 
         if rpcuser and rpcpassword:
-            break
+            url = DEFAULT_RPC_URL
+            if rpcport and rpcport.isdigit():
+                url = f"http://127.0.0.1:{rpcport}/"
+            _write_cred_cache(path, st.st_mtime, rpcuser, rpcpassword, url)
+            _cred_memo = (rpcuser, rpcpassword, url)
+            return _cred_memo
 
     url = DEFAULT_RPC_URL
     if rpcport and rpcport.isdigit():
@@ -58,32 +134,55 @@ def load_rpc_credentials_from_conf() -> Tuple[Optional[str], Optional[str], Opti
     return rpcuser, rpcpassword, url
 
 
+# Shared timeout objects - building a ClientTimeout per call is wasted work
+# in the polling loops
+_CALL_TIMEOUT = aiohttp.ClientTimeout(total=60)
+_BATCH_TIMEOUT = aiohttp.ClientTimeout(total=120)
+
+
 @dataclass
-class RpcClient:
+class AsyncRpcClient:
     url: str
     user: str
     password: str
+    _session: Optional[aiohttp.ClientSession] = None
+    _post: Any = None
+    _batch_post: Any = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Lazily created so the client can be constructed outside the event loop;
+        # one session means one keep-alive connection pool for all RPCs.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                auth=aiohttp.BasicAuth(self.user, self.password),
+                headers={"Content-Type": "application/json"},
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60),
+            )
+            # Pre-bind the url/timeout so the hot path skips the per-call
+            # attribute lookups and keyword re-assembly
+            self._post = functools.partial(self._session.post, self.url, timeout=_CALL_TIMEOUT)
+            self._batch_post = functools.partial(self._session.post, self.url, timeout=_BATCH_TIMEOUT)
+        return self._session
 
-    def call(self, method: str, params: List[Any]) -> Any:
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def call(self, method: str, params: List[Any]) -> Any:
         payload = {
             "jsonrpc": "1.0",
             "id": "vlotto_tui",
             "method": method,
             "params": params,
         }
+        self._get_session()
         try:
-            resp = requests.post(
-                self.url,
-                headers={"Content-Type": "application/json"},
-                json=payload,
-                auth=(self.user, self.password),
-                timeout=60,
-            )
-            data = resp.json()
-        except (ConnectionError, Timeout, RequestException) as e:
+            async with self._post(data=_json_dumps(payload)) as resp:
+                data = _json_loads(await resp.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise RuntimeError(f"RPC connection error: {e}")
         except ValueError:
-            raise RuntimeError(f"RPC returned non-JSON response (HTTP {getattr(resp, 'status_code', 'n/a')})")
+            raise RuntimeError("RPC returned non-JSON response")
 
         if data.get("error"):
             err = data["error"]
@@ -93,22 +192,17 @@ class RpcClient:
 
         return data.get("result")
 
-    def batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+    async def batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
         """Send multiple RPC calls in a single HTTP request (JSON-RPC batch)."""
         payloads = [
             {"jsonrpc": "1.0", "id": f"batch_{i}", "method": method, "params": params}
             for i, (method, params) in enumerate(calls)
         ]
+        self._get_session()
         try:
-            resp = requests.post(
-                self.url,
-                headers={"Content-Type": "application/json"},
-                json=payloads,
-                auth=(self.user, self.password),
-                timeout=120,
-            )
-            data = resp.json()
-        except (ConnectionError, Timeout, RequestException) as e:
+            async with self._batch_post(data=_json_dumps(payloads)) as resp:
+                data = _json_loads(await resp.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise RuntimeError(f"RPC connection error: {e}")
         except ValueError:
             raise RuntimeError(f"RPC returned non-JSON response")
@@ -126,62 +220,119 @@ class RpcClient:
         return results
 
 
-def sleep_ms(ms: int) -> None:
-    time.sleep(ms / 1000.0)
+async def sleep_ms(ms: float) -> None:
+    await asyncio.sleep(ms / 1000.0)
+
+
+class BlockWatcher:
+    """Signal new blocks from verusd's ZMQ publisher (VERUS_ZMQ env var).
+
+    If no endpoint is configured or pyzmq is not installed, the watcher is
+    inactive and waiters fall back to polling with exponential backoff.
+    """
+
+    def __init__(self, endpoint: Optional[str] = None):
+        self.endpoint = endpoint or os.environ.get("VERUS_ZMQ")
+        self._event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self.endpoint) and zmq is not None
+
+    def start(self) -> None:
+        if self.active and self._task is None:
+            self._task = asyncio.create_task(self._watch())
+
+    async def _watch(self) -> None:
+        ctx = zmq.asyncio.Context()
+        sock = ctx.socket(zmq.SUB)
+        sock.setsockopt(zmq.SUBSCRIBE, b"hashblock")
+        sock.setsockopt(zmq.SUBSCRIBE, b"hashtx")
+        sock.connect(self.endpoint)
+        try:
+            while True:
+                await sock.recv_multipart()
+                self._event.set()
+        finally:
+            sock.close(0)
+            ctx.term()
+
+    async def wait_for_notification(self, timeout: float) -> None:
+        """Wait until the daemon publishes something new, or timeout elapses."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._event.clear()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
 
 
 def extract_offers_list(getoffers_result: Any) -> List[Dict[str, Any]]:
     if isinstance(getoffers_result, list):
         return getoffers_result
     if isinstance(getoffers_result, dict):
-        list_values = [v for v in getoffers_result.values() if isinstance(v, list)]
-        if len(list_values) == 1:
-            return list_values[0]
+        # Accept the dict form only when it contains exactly one list value;
+        # a single pass that bails on the second list, nothing materialized.
+        only = None
+        for v in getoffers_result.values():
+            if isinstance(v, list):
+                if only is not None:
+                    return []
+                only = v
+        return only if only is not None else []
     return []
 
 
-def parse_ticket_name(name: str) -> Dict[str, Any]:
-    """Parse ticket name like '3906000_32of32' into components."""
-    result = {"raw": name, "draw_block": None, "ticket_num": None, "total_tickets": None}
-    if "_" not in name:
-        return result
-    parts = name.split("_", 1)
-    try:
-        result["draw_block"] = int(parts[0])
-    except ValueError:
-        pass
-    if len(parts) > 1 and "of" in parts[1]:
-        ticket_part = parts[1]
-        of_parts = ticket_part.split("of")
-        if len(of_parts) == 2:
-            try:
-                result["ticket_num"] = int(of_parts[0])
-                result["total_tickets"] = int(of_parts[1])
-            except ValueError:
-                pass
-    return result
+# Ticket names look like "3906000_32of32": <draw_block>_<ticket_num>of<total>
+_TICKET_RE = re.compile(r"(\d+)_(\d+)of(\d+)")
+
+
+def parse_ticket_name(name: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Parse a ticket name into (draw_block, ticket_num, total_tickets).
+
+    Returns (None, None, None) for malformed names - no exception control flow.
+    """
+    m = _TICKET_RE.fullmatch(name)
+    if m is None:
+        return (None, None, None)
+    return (int(m[1]), int(m[2]), int(m[3]))
 
 
 def summarize_offers(offers: List[Dict[str, Any]]) -> Dict[str, Any]:
-    by_draw: Dict[str, List[str]] = {}
-    names = []
-    draw_info: Dict[str, Dict[str, Any]] = {}
-    
+    # Draws are keyed by the integer draw block; callers format for display.
+    by_draw: Dict[int, List[str]] = defaultdict(list)
+    names: List[str] = []
+    draw_info: Dict[int, Dict[str, Any]] = {}
+
+    # Hot path for large marketplaces: bind the append once and avoid the
+    # extra hash probes setdefault/'in' would cost per offer.
+    names_append = names.append
+
     for o in offers:
-        name = (((o or {}).get("offer") or {}).get("offer") or {}).get("name")
+        off = o.get("offer") if o else None
+        off2 = off.get("offer") if off else None
+        name = off2.get("name") if off2 else None
         if not name:
             continue
-        names.append(name)
-        parsed = parse_ticket_name(name)
-        draw_block = parsed.get("draw_block")
-        if draw_block:
-            draw_key = str(draw_block)
-            by_draw.setdefault(draw_key, []).append(name)
-            if draw_key not in draw_info:
-                draw_info[draw_key] = {
-                    "draw_block": draw_block,
-                    "total_tickets": parsed.get("total_tickets"),
-                }
+        names_append(name)
+        draw_block, _ticket_num, total_tickets = parse_ticket_name(name)
+        if not draw_block:
+            continue
+        by_draw[draw_block].append(name)
+        if draw_info.get(draw_block) is None:
+            draw_info[draw_block] = {
+                "draw_block": draw_block,
+                "total_tickets": total_tickets,
+            }
 
     draws_sorted = sorted(by_draw.items(), key=lambda kv: (-len(kv[1]), kv[0]))
     return {
@@ -192,28 +343,54 @@ def summarize_offers(offers: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def get_currency_balance(rpc: RpcClient, address: str, currency: str) -> float:
-    """Get balance of a specific currency for an address."""
+def extract_balance(bal_dict: Any, currency: str) -> float:
+    """Pull one currency's balance from a getcurrencybalance result dict."""
+    if isinstance(bal_dict, dict):
+        # Try exact match first, then case-insensitive
+        if currency in bal_dict:
+            return float(bal_dict[currency])
+        for k, v in bal_dict.items():
+            if k.lower() == currency.lower():
+                return float(v)
+    return 0.0
+
+
+# getcurrencybalance returns every currency for an address, and main() reads
+# the same vlotto/VRSC pair several times per screen - cache the raw dict per
+# address with a short TTL so back-to-back reads share one RPC.
+_balance_cache: Dict[str, Tuple[float, Any]] = {}
+_BALANCE_TTL = 1.0
+
+
+def invalidate_balance_cache() -> None:
+    _balance_cache.clear()
+
+
+def prime_balance_cache(address: str, bal_dict: Any) -> None:
+    """Seed the cache with an externally fetched getcurrencybalance result."""
+    _balance_cache[address] = (time.monotonic(), bal_dict)
+
+
+async def get_currency_balance(rpc: AsyncRpcClient, address: str, currency: str) -> float:
+    """Get balance of a specific currency for an address (cached briefly)."""
     try:
-        # getcurrencybalance returns dict of {currency: balance}
-        bal_dict = rpc.call("getcurrencybalance", [address])
-        if isinstance(bal_dict, dict):
-            # Try exact match first, then case-insensitive
-            if currency in bal_dict:
-                return float(bal_dict[currency])
-            for k, v in bal_dict.items():
-                if k.lower() == currency.lower():
-                    return float(v)
-        return 0.0
+        now = time.monotonic()
+        cached = _balance_cache.get(address)
+        if cached is not None and now - cached[0] < _BALANCE_TTL:
+            bal_dict = cached[1]
+        else:
+            # getcurrencybalance returns dict of {currency: balance}
+            bal_dict = await rpc.call("getcurrencybalance", [address])
+            _balance_cache[address] = (now, bal_dict)
+        return extract_balance(bal_dict, currency)
     except Exception:
         return 0.0
 
 
-def get_addresses_with_vrsc(rpc: RpcClient, min_balance: float = 0.0) -> List[Tuple[str, float]]:
-    """Get list of addresses with VRSC balance >= min_balance."""
+def parse_address_groupings(groupings: Any, min_balance: float = 0.0) -> List[Tuple[str, float]]:
+    """Parse listaddressgroupings output into (address, balance) pairs with balance >= min_balance."""
     result = []
     try:
-        groupings = rpc.call("listaddressgroupings", [])
         if isinstance(groupings, list):
             for group in groupings:
                 if isinstance(group, list):
@@ -229,41 +406,38 @@ def get_addresses_with_vrsc(rpc: RpcClient, min_balance: float = 0.0) -> List[Tu
     return result
 
 
-def get_best_exact_out_converter(rpc: RpcClient, from_currency: str, to_currency: str, to_amount: float) -> Tuple[float, str]:
+def _converter_required(c: Any) -> float:
+    """Source amount a converter needs, or inf when the entry is unusable."""
+    via = (c or {}).get("fullyqualifiedname")
+    sourceamounts = (c or {}).get("sourceamounts")
+    if not via or not isinstance(sourceamounts, dict) or not sourceamounts:
+        return math.inf
+    # Stream to the first positive, non-NaN value - no intermediate lists
+    it = (float(v) for v in sourceamounts.values() if isinstance(v, (int, float, str)))
+    required = next((v for v in it if v == v and v > 0), None)
+    return required if required is not None else math.inf
+
+
+async def get_best_exact_out_converter(rpc: AsyncRpcClient, from_currency: str, to_currency: str, to_amount: float) -> Tuple[float, str]:
     query = {
         "fromcurrency": [{"currency": from_currency}],
         "convertto": to_currency,
         "amount": round(float(to_amount), 8),
     }
 
-    res = rpc.call("getcurrencyconverters", [json.dumps(query)])
+    res = await rpc.call("getcurrencyconverters", [_json_dumps(query).decode("utf-8")])
     if not isinstance(res, list) or not res:
         raise RuntimeError(f"No converters found for {from_currency} -> {to_currency}")
 
-    best_required = None
-    best_via = None
-
-    for c in res:
-        via = (c or {}).get("fullyqualifiedname")
-        sourceamounts = (c or {}).get("sourceamounts")
-        if not via or not isinstance(sourceamounts, dict) or not sourceamounts:
-            continue
-        vals = [float(v) for v in sourceamounts.values() if isinstance(v, (int, float, str))]
-        vals = [v for v in vals if v == v and v > 0]
-        if not vals:
-            continue
-        required = vals[0]
-        if best_required is None or required < best_required:
-            best_required = required
-            best_via = via
-
-    if best_required is None or best_via is None:
+    best = min(res, key=_converter_required)
+    best_required = _converter_required(best)
+    if best_required == math.inf:
         raise RuntimeError(f"No usable converter route found for {from_currency} -> {to_currency}")
 
-    return round(float(best_required), 8), best_via
+    return round(best_required, 8), (best or {}).get("fullyqualifiedname")
 
 
-def sendcurrency_convert(rpc: RpcClient, from_address: str, from_currency: str, to_currency: str, amount_in: float, via: Optional[str]) -> str:
+async def sendcurrency_convert(rpc: AsyncRpcClient, from_address: str, from_currency: str, to_currency: str, amount_in: float, via: Optional[str]) -> str:
     obj: Dict[str, Any] = {
         "address": from_address,
         "amount": round(float(amount_in), 8),
@@ -275,7 +449,9 @@ def sendcurrency_convert(rpc: RpcClient, from_address: str, from_currency: str,
     if via and via.lower() != to_currency.lower():
         obj["via"] = via
 
-    result = rpc.call("sendcurrency", [from_address, [obj]])
+    result = await rpc.call("sendcurrency", [from_address, [obj]])
+    # The submitted tx will change balances - drop any cached values
+    invalidate_balance_cache()
     if isinstance(result, str):
         return result
     if isinstance(result, dict) and "txid" in result:
@@ -283,11 +459,12 @@ def sendcurrency_convert(rpc: RpcClient, from_address: str, from_currency: str,
     return str(result)
 
 
-def wait_for_opid_success(rpc: RpcClient, opid: str) -> str:
+async def wait_for_opid_success(rpc: AsyncRpcClient, opid: str) -> str:
     """Wait indefinitely for opid to complete. Returns txid on success."""
     print(f"    Waiting for operation {opid[:20]}...")
+    delay = 500.0
     while True:
-        status = rpc.call("z_getoperationstatus", [[opid]])
+        status = await rpc.call("z_getoperationstatus", [[opid]])
         if isinstance(status, list) and status:
             s0 = status[0]
             st = s0.get("status")
@@ -300,13 +477,14 @@ def wait_for_opid_success(rpc: RpcClient, opid: str) -> str:
                 raise RuntimeError(err or "Operation failed")
             # Still executing/queued
             print(f"    Status: {st}...", end="\r")
-        sleep_ms(3000)
+        await sleep_ms(delay)
+        delay = min(delay * 1.5, 5000.0)
 
 
-def get_tx_confirmations(rpc: RpcClient, txid: str) -> int:
+async def get_tx_confirmations(rpc: AsyncRpcClient, txid: str) -> int:
     """Get confirmations for a txid. Returns -1 if orphaned, 0 if pending."""
     try:
-        tx = rpc.call("gettransaction", [txid])
+        tx = await rpc.call("gettransaction", [txid])
         if isinstance(tx, dict):
             return tx.get("confirmations", 0)
     except Exception:
@@ -314,36 +492,54 @@ def get_tx_confirmations(rpc: RpcClient, txid: str) -> int:
     return 0
 
 
-def wait_for_tx_confirmed(rpc: RpcClient, txid: str, min_confirmations: int = 1) -> int:
-    """Wait for tx to get confirmations. Returns confirmations count."""
+async def wait_for_tx_confirmed(rpc: AsyncRpcClient, txid: str, min_confirmations: int = 1, watcher: Optional[BlockWatcher] = None) -> int:
+    """Wait for tx to get confirmations. Returns confirmations count.
+
+    With an active BlockWatcher, only re-poll when the daemon announces a new
+    block/tx; otherwise back off exponentially instead of hard-polling.
+    """
     print(f"    Waiting for tx {txid[:16]}... to confirm")
+    delay = 500.0
     while True:
-        confs = get_tx_confirmations(rpc, txid)
+        confs = await get_tx_confirmations(rpc, txid)
         if confs >= min_confirmations:
             print(f"    Confirmed with {confs} confirmations")
             return confs
         if confs == -1:
             raise RuntimeError(f"Transaction {txid} was orphaned (confirmations=-1)")
         print(f"    Confirmations: {confs} (waiting for {min_confirmations})...", end="\r")
-        sleep_ms(5000)
+        if watcher is not None and watcher.active:
+            await watcher.wait_for_notification(timeout=15.0)
+        else:
+            await sleep_ms(delay)
+            delay = min(delay * 1.5, 15000.0)
 
 
-def wait_for_balance(rpc: RpcClient, address: str, currency: str, min_balance: float) -> float:
-    """Wait indefinitely for balance to reach min_balance."""
+async def wait_for_balance(rpc: AsyncRpcClient, address: str, currency: str, min_balance: float, watcher: Optional[BlockWatcher] = None) -> float:
+    """Wait indefinitely for balance to reach min_balance.
+
+    Re-checks on daemon notifications when a BlockWatcher is active,
+    otherwise backs off exponentially.
+    """
     print(f"    Waiting for {currency} balance >= {min_balance:.4f}...")
+    delay = 500.0
     while True:
-        bal = get_currency_balance(rpc, address, currency)
+        bal = await get_currency_balance(rpc, address, currency)
         if bal >= min_balance:
             print(f"    Balance: {bal:.8f} {currency}")
             return bal
         print(f"    Balance: {bal:.8f} (need {min_balance:.4f})...", end="\r")
-        sleep_ms(5000)
+        if watcher is not None and watcher.active:
+            await watcher.wait_for_notification(timeout=15.0)
+        else:
+            await sleep_ms(delay)
+            delay = min(delay * 1.5, 15000.0)
 
 
 VLOTTO_CURRENCY_ID = "iMLmoaN3SS8KdJwb7fG4WZxJMFrjJxHBfj"
 
 
-def get_ledger_info(rpc: 'RpcClient') -> Dict[str, Any]:
+async def get_ledger_info(rpc: AsyncRpcClient) -> Dict[str, Any]:
     """Fetch ledger.vlotto@ and parse lottery parameters from contentmultimap."""
     info = {
         "jackpot": None,
@@ -354,45 +550,50 @@ def get_ledger_info(rpc: 'RpcClient') -> Dict[str, Any]:
         "current_phase": None,
     }
     try:
-        ledger = rpc.call("getidentity", ["ledger.vlotto@"])
+        ledger = await rpc.call("getidentity", ["ledger.vlotto@"])
         if not isinstance(ledger, dict):
             return info
         
         identity = ledger.get("identity", {})
         contentmultimap = identity.get("contentmultimap", {})
-        
-        # Parse the nested JSON from contentmultimap
-        for key, entries in contentmultimap.items():
-            if isinstance(entries, list):
-                for entry in entries:
-                    if isinstance(entry, dict):
-                        for inner_key, inner_val in entry.items():
-                            if isinstance(inner_val, dict):
-                                obj_data = inner_val.get("objectdata", {})
-                                message = obj_data.get("message", "")
-                                if message and message.startswith("{"):
-                                    try:
-                                        data = json.loads(message)
-                                        params = data.get("lotteryParameters", {})
-                                        financial = data.get("financialSummary", {})
-                                        tickets = data.get("ticketSummary", {})
-                                        
-                                        info["jackpot"] = financial.get("jackpotCurrent")
-                                        info["required_matches"] = params.get("requiredMatches")
-                                        info["drawing_block"] = params.get("drawingBlock")
-                                        info["total_tickets"] = tickets.get("planned")
-                                        info["tickets_on_marketplace"] = tickets.get("onMarketplace")
-                                        info["current_phase"] = data.get("currentPhase")
-                                        return info
-                                    except json.JSONDecodeError:
-                                        pass
+
+        # Parse the nested JSON from contentmultimap - keys are irrelevant,
+        # so walk values only and skip non-message entries before decoding
+        for entries in contentmultimap.values():
+            if not isinstance(entries, list):
+                continue
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                for inner_val in entry.values():
+                    if not (
+                        isinstance(inner_val, dict)
+                        and (msg := (inner_val.get("objectdata") or {}).get("message"))
+                        and msg[:1] == "{"
+                    ):
+                        continue
+                    try:
+                        data = _json_loads(msg)
+                    except ValueError:  # covers both json and orjson decode errors
+                        continue
+                    params = data.get("lotteryParameters", {})
+                    financial = data.get("financialSummary", {})
+                    tickets = data.get("ticketSummary", {})
+
+                    info["jackpot"] = financial.get("jackpotCurrent")
+                    info["required_matches"] = params.get("requiredMatches")
+                    info["drawing_block"] = params.get("drawingBlock")
+                    info["total_tickets"] = tickets.get("planned")
+                    info["tickets_on_marketplace"] = tickets.get("onMarketplace")
+                    info["current_phase"] = data.get("currentPhase")
+                    return info
     except Exception:
         pass
     return info
 
 
-def take_ticket_offer(
-    rpc: RpcClient,
+async def take_ticket_offer(
+    rpc: AsyncRpcClient,
     from_address: str,
     change_address: str,
     offer_entry: Dict[str, Any],
@@ -433,7 +634,10 @@ def take_ticket_offer(
     if returntx:
         params.append(True)
 
-    result = rpc.call("takeoffer", params)
+    result = await rpc.call("takeoffer", params)
+    # A successful takeoffer adds a ticket identity and spends vlotto
+    invalidate_identities_cache()
+    invalidate_balance_cache()
     return {
         "offer_txid": offer_txid,
         "ticket": ticket_name,
@@ -448,12 +652,45 @@ def prompt(text: str, default: Optional[str] = None) -> str:
     return v if v else default
 
 
-def get_my_tickets(rpc: RpcClient, address: Optional[str] = None) -> List[str]:
+# Short-TTL cache for the raw listidentities result: get_my_tickets is called
+# several times per run and the full identity list only changes when we buy.
+_listidentities_cache: Optional[Tuple[float, List[Any]]] = None
+_LISTIDENTITIES_TTL = 10.0
+
+
+def invalidate_identities_cache() -> None:
+    global _listidentities_cache
+    _listidentities_cache = None
+
+
+async def _list_identities(rpc: AsyncRpcClient) -> List[Any]:
+    global _listidentities_cache
+    now = time.monotonic()
+    cache = _listidentities_cache
+    if cache is not None and now - cache[0] < _LISTIDENTITIES_TTL:
+        return cache[1]
+    ids = await rpc.call("listidentities", [])
+    if not isinstance(ids, list):
+        ids = []
+    _listidentities_cache = (now, ids)
+    return ids
+
+
+def filter_by_prefix(sorted_names: List[str], prefix: str) -> List[str]:
+    """Slice the entries starting with prefix out of a sorted list in O(log N)."""
+    if not prefix:
+        return sorted_names
+    lo = bisect.bisect_left(sorted_names, prefix)
+    hi = bisect.bisect_right(sorted_names, prefix + "\U0010ffff", lo)
+    return sorted_names[lo:hi]
+
+
+async def get_my_tickets(rpc: AsyncRpcClient, address: Optional[str] = None) -> List[str]:
     """Get list of vlotto ticket identities owned by wallet (optionally filter by address)."""
     tickets = []
     try:
-        # listidentities returns identities controlled by wallet
-        ids = rpc.call("listidentities", [])
+        # listidentities returns identities controlled by wallet (cached briefly)
+        ids = await _list_identities(rpc)
         if isinstance(ids, list):
             for id_entry in ids:
                 if isinstance(id_entry, dict):
@@ -474,7 +711,7 @@ def get_my_tickets(rpc: RpcClient, address: Optional[str] = None) -> List[str]:
     return sorted(tickets)
 
 
-def main() -> None:
+async def main() -> None:
     buffer_percent = 0.01
     dry_run = False
 
@@ -496,364 +733,432 @@ def main() -> None:
         if not rpcuser or not rpcpass:
             raise SystemExit("RPC credentials required.")
 
-    rpc = RpcClient(url=url, user=rpcuser, password=rpcpass)
+    rpc = AsyncRpcClient(url=url, user=rpcuser, password=rpcpass)
+    watcher = BlockWatcher()
+
+    try:
+        watcher.start()
 
-    print("=" * 60)
-    print("          vLotto Ticket Buyer (TUI)")
-    print("=" * 60)
+        print("=" * 60)
+        print("          vLotto Ticket Buyer (TUI)")
+        print("=" * 60)
 
-    info = rpc.call("getinfo", [])
-    current_height = info.get("blocks") if isinstance(info, dict) else 0
-    print(f"\nConnected to verusd | Current block: {current_height}")
+        # These startup RPCs are independent of each other - fetch them all
+        # in one round trip's worth of wall clock instead of serially.
+        info, offers_raw, ledger_info, groupings = await asyncio.gather(
+            rpc.call("getinfo", []),
+            rpc.call("getoffers", ["vlotto", True]),
+            get_ledger_info(rpc),
+            rpc.call("listaddressgroupings", []),
+        )
 
-    # Fetch offers and parse draw info
-    offers_raw = rpc.call("getoffers", ["vlotto", True])
-    offers = extract_offers_list(offers_raw)
-    summary = summarize_offers(offers)
+        current_height = info.get("blocks") if isinstance(info, dict) else 0
+        print(f"\nConnected to verusd | Current block: {current_height}")
 
-    # Fetch ledger info for jackpot and win criteria
-    ledger_info = get_ledger_info(rpc)
+        # Parse offers and draw info
+        offers = extract_offers_list(offers_raw)
+        summary = summarize_offers(offers)
     
-    # Display draw information
-    print("\n" + "-" * 60)
-    print("                   DRAW INFORMATION")
-    print("-" * 60)
+        # Display draw information
+        print("\n" + "-" * 60)
+        print("                   DRAW INFORMATION")
+        print("-" * 60)
     
-    if summary["draws"]:
-        draw_key, ticket_names = summary["draws"][0]
-        draw_meta = summary["draw_info"].get(draw_key, {})
-        draw_block = ledger_info.get("drawing_block") or draw_meta.get("draw_block", int(draw_key) if draw_key.isdigit() else None)
-        total_tickets = ledger_info.get("total_tickets") or draw_meta.get("total_tickets")
-        available_tickets = len(ticket_names)
-        jackpot = ledger_info.get("jackpot")
-        required_matches = ledger_info.get("required_matches")
-        current_phase = ledger_info.get("current_phase")
+        if summary["draws"]:
+            draw_key, ticket_names = summary["draws"][0]
+            draw_meta = summary["draw_info"].get(draw_key, {})
+            draw_block = ledger_info.get("drawing_block") or draw_meta.get("draw_block", draw_key)
+            total_tickets = ledger_info.get("total_tickets") or draw_meta.get("total_tickets")
+            available_tickets = len(ticket_names)
+            jackpot = ledger_info.get("jackpot")
+            required_matches = ledger_info.get("required_matches")
+            current_phase = ledger_info.get("current_phase")
         
-        if draw_block and current_height:
-            blocks_until = draw_block - current_height
-            est_minutes = blocks_until  # ~1 block per minute
-            est_hours = est_minutes / 60
-            if est_hours >= 1:
-                time_str = f"~{est_hours:.1f} hours"
+            if draw_block and current_height:
+                blocks_until = draw_block - current_height
+                est_minutes = blocks_until  # ~1 block per minute
+                est_hours = est_minutes / 60
+                if est_hours >= 1:
+                    time_str = f"~{est_hours:.1f} hours"
+                else:
+                    time_str = f"~{est_minutes} minutes"
             else:
-                time_str = f"~{est_minutes} minutes"
-        else:
-            blocks_until = None
-            time_str = "unknown"
+                blocks_until = None
+                time_str = "unknown"
         
-        print(f"  Draw Block:        {draw_block or 'unknown'}")
-        if blocks_until is not None:
-            print(f"  Blocks Until Draw: {blocks_until} ({time_str})")
-        if jackpot is not None:
-            print(f"  Jackpot:           {jackpot} vlotto")
-        if required_matches is not None:
-            print(f"  Matches to Win:    {required_matches}")
-        if total_tickets:
-            print(f"  Total Tickets:     {total_tickets}")
-        print(f"  Available Offers:  {available_tickets} of {total_tickets or '?'}")
-        print(f"  Ticket Price:      1.0 vlotto each")
-        if current_phase:
-            phase_display = current_phase.replace("_", " ").replace("phase", "Phase ")
-            print(f"  Current Phase:     {phase_display}")
+            print(f"  Draw Block:        {draw_block or 'unknown'}")
+            if blocks_until is not None:
+                print(f"  Blocks Until Draw: {blocks_until} ({time_str})")
+            if jackpot is not None:
+                print(f"  Jackpot:           {jackpot} vlotto")
+            if required_matches is not None:
+                print(f"  Matches to Win:    {required_matches}")
+            if total_tickets:
+                print(f"  Total Tickets:     {total_tickets}")
+            print(f"  Available Offers:  {available_tickets} of {total_tickets or '?'}")
+            print(f"  Ticket Price:      1.0 vlotto each")
+            if current_phase:
+                phase_display = current_phase.replace("_", " ").replace("phase", "Phase ")
+                print(f"  Current Phase:     {phase_display}")
         
-        # Show user's current tickets for this draw (all addresses in wallet)
-        my_tickets = get_my_tickets(rpc)
-        draw_prefix = str(draw_block) + "_" if draw_block else ""
-        my_draw_tickets = [t for t in my_tickets if t.startswith(draw_prefix)]
-        print(f"\n  Your Tickets:      {len(my_draw_tickets)} for this draw (all wallet addresses)")
-        if my_draw_tickets:
-            print(f"    {', '.join(sorted(my_draw_tickets))}")
-    else:
-        draw_block = ledger_info.get("drawing_block")
-        total_tickets = ledger_info.get("total_tickets")
-        jackpot = ledger_info.get("jackpot")
-        required_matches = ledger_info.get("required_matches")
-        current_phase = ledger_info.get("current_phase")
-        available_tickets = 0
-
-        if draw_block and current_height:
-            blocks_until = draw_block - current_height
-            est_minutes = blocks_until  # ~1 block per minute
-            est_hours = est_minutes / 60
-            if est_hours >= 1:
-                time_str = f"~{est_hours:.1f} hours"
-            else:
-                time_str = f"~{est_minutes} minutes"
+            # Show user's current tickets for this draw (all addresses in wallet)
+            my_tickets = await get_my_tickets(rpc)
+            draw_prefix = f"{draw_block}_" if draw_block else ""
+            my_draw_tickets = filter_by_prefix(my_tickets, draw_prefix)
+            print(f"\n  Your Tickets:      {len(my_draw_tickets)} for this draw (all wallet addresses)")
+            if my_draw_tickets:
+                print(f"    {', '.join(my_draw_tickets)}")
         else:
-            blocks_until = None
-            time_str = "unknown"
-
-        print(f"  Draw Block:        {draw_block or 'unknown'}")
-        if blocks_until is not None:
-            print(f"  Blocks Until Draw: {blocks_until} ({time_str})")
-        if jackpot is not None:
-            print(f"  Jackpot:           {jackpot} vlotto")
-        if required_matches is not None:
-            print(f"  Matches to Win:    {required_matches}")
-        if total_tickets:
-            print(f"  Total Tickets:     {total_tickets}")
-        print(f"  Available Offers:  {available_tickets} of {total_tickets or '?'}")
-        print(f"  Ticket Price:      1.0 vlotto each")
-        if current_phase:
-            phase_display = current_phase.replace("_", " ").replace("phase", "Phase ")
-            print(f"  Current Phase:     {phase_display}")
-
-        my_tickets = get_my_tickets(rpc)
-        draw_prefix = str(draw_block) + "_" if draw_block else ""
-        my_draw_tickets = [t for t in my_tickets if t.startswith(draw_prefix)]
-        print(f"\n  Your Tickets:      {len(my_draw_tickets)} for this draw (all wallet addresses)")
-        if my_draw_tickets:
-            print(f"    {', '.join(sorted(my_draw_tickets))}")
-
-        print("\nNo tickets available to purchase.")
-        raise SystemExit(0)
-
-    # Get addresses with VRSC balance
-    print("\n" + "-" * 60)
-    print("                   SELECT ADDRESS")
-    print("-" * 60)
+            draw_block = ledger_info.get("drawing_block")
+            total_tickets = ledger_info.get("total_tickets")
+            jackpot = ledger_info.get("jackpot")
+            required_matches = ledger_info.get("required_matches")
+            current_phase = ledger_info.get("current_phase")
+            available_tickets = 0
+
+            if draw_block and current_height:
+                blocks_until = draw_block - current_height
+                est_minutes = blocks_until  # ~1 block per minute
+                est_hours = est_minutes / 60
+                if est_hours >= 1:
+                    time_str = f"~{est_hours:.1f} hours"
+                else:
+                    time_str = f"~{est_minutes} minutes"
+            else:
+                blocks_until = None
+                time_str = "unknown"
+
+            print(f"  Draw Block:        {draw_block or 'unknown'}")
+            if blocks_until is not None:
+                print(f"  Blocks Until Draw: {blocks_until} ({time_str})")
+            if jackpot is not None:
+                print(f"  Jackpot:           {jackpot} vlotto")
+            if required_matches is not None:
+                print(f"  Matches to Win:    {required_matches}")
+            if total_tickets:
+                print(f"  Total Tickets:     {total_tickets}")
+            print(f"  Available Offers:  {available_tickets} of {total_tickets or '?'}")
+            print(f"  Ticket Price:      1.0 vlotto each")
+            if current_phase:
+                phase_display = current_phase.replace("_", " ").replace("phase", "Phase ")
+                print(f"  Current Phase:     {phase_display}")
+
+            my_tickets = await get_my_tickets(rpc)
+            draw_prefix = f"{draw_block}_" if draw_block else ""
+            my_draw_tickets = filter_by_prefix(my_tickets, draw_prefix)
+            print(f"\n  Your Tickets:      {len(my_draw_tickets)} for this draw (all wallet addresses)")
+            if my_draw_tickets:
+                print(f"    {', '.join(my_draw_tickets)}")
+
+            print("\nNo tickets available to purchase.")
+            raise SystemExit(0)
+
+        # Get addresses with VRSC balance
+        print("\n" + "-" * 60)
+        print("                   SELECT ADDRESS")
+        print("-" * 60)
     
-    addresses = get_addresses_with_vrsc(rpc, min_balance=0.001)
+        addresses = parse_address_groupings(groupings, min_balance=0.001)
     
-    address = os.environ.get("VERUS_ADDRESS")
+        address = os.environ.get("VERUS_ADDRESS")
     
-    if not address:
-        if not addresses:
-            print("No addresses with VRSC balance found.")
-            address = prompt("Enter address manually")
-        else:
-            print("\nAddresses with VRSC balance:")
-            for i, (addr, bal) in enumerate(addresses):
-                vlotto_bal = get_currency_balance(rpc, addr, "vlotto")
-                print(f"  [{i+1}] {addr}")
-                print(f"      VRSC: {bal:.8f}  |  vlotto: {vlotto_bal:.8f}")
-            print()
-            choice = prompt(f"Select address (1-{len(addresses)}) or enter manually", default="1")
-            try:
-                idx = int(choice) - 1
-                if 0 <= idx < len(addresses):
-                    address = addresses[idx][0]
-                else:
+        if not address:
+            if not addresses:
+                print("No addresses with VRSC balance found.")
+                address = prompt("Enter address manually")
+            else:
+                # One JSON-RPC batch covers both columns of the table (the
+                # response holds every currency per address) and seeds the
+                # balance cache for follow-up reads.
+                calls = [("getcurrencybalance", [addr]) for addr, _ in addresses]
+                balance_results = await rpc.batch_call(calls)
+                if len(balance_results) != len(addresses):
+                    # Short or malformed batch response - don't let zip drop
+                    # rows; degrade to the listaddressgroupings figures
+                    balance_results = [{}] * len(addresses)
+                print("\nAddresses with VRSC balance:")
+                for i, ((addr, bal), res) in enumerate(zip(addresses, balance_results)):
+                    bal_dict = res.get("result")
+                    if bal_dict is not None:
+                        prime_balance_cache(addr, bal_dict)
+                        vrsc_bal = extract_balance(bal_dict, "VRSC")
+                    else:
+                        vrsc_bal = bal  # fall back to the grouping's figure
+                    vlotto_bal = extract_balance(bal_dict, "vlotto")
+                    print(f"  [{i+1}] {addr}")
+                    print(f"      VRSC: {vrsc_bal:.8f}  |  vlotto: {vlotto_bal:.8f}")
+                print()
+                choice = prompt(f"Select address (1-{len(addresses)}) or enter manually", default="1")
+                try:
+                    idx = int(choice) - 1
+                    if 0 <= idx < len(addresses):
+                        address = addresses[idx][0]
+                    else:
+                        address = choice
+                except ValueError:
                     address = choice
-            except ValueError:
-                address = choice
 
-    # Get balances for selected address
-    vlotto_balance = get_currency_balance(rpc, address, "vlotto")
-    vrsc_balance = get_currency_balance(rpc, address, "VRSC")
+        # Get balances for selected address (independent - fetch concurrently)
+        vlotto_balance, vrsc_balance = await asyncio.gather(
+            get_currency_balance(rpc, address, "vlotto"),
+            get_currency_balance(rpc, address, "VRSC"),
+        )
     
-    print(f"\nSelected address: {address}")
-    print(f"  VRSC balance:   {vrsc_balance:.8f}")
-    print(f"  vLotto balance: {vlotto_balance:.8f}")
+        print(f"\nSelected address: {address}")
+        print(f"  VRSC balance:   {vrsc_balance:.8f}")
+        print(f"  vLotto balance: {vlotto_balance:.8f}")
 
-    change_address = address  # Use same address for change
+        change_address = address  # Use same address for change
 
-    # Ask how many tickets
-    print("\n" + "-" * 60)
-    print("                   BUY TICKETS")
-    print("-" * 60)
+        # Ask how many tickets
+        print("\n" + "-" * 60)
+        print("                   BUY TICKETS")
+        print("-" * 60)
     
-    max_affordable = int(vlotto_balance) if vlotto_balance >= 1.0 else 0
-    available = len(ticket_names) if summary["draws"] else 0
+        max_affordable = int(vlotto_balance) if vlotto_balance >= 1.0 else 0
+        available = len(ticket_names) if summary["draws"] else 0
     
-    print(f"\n  You can afford:    {max_affordable} tickets (with current vlotto)")
-    print(f"  Available offers:  {available} tickets")
-    print(f"  (If you need more vlotto, we will swap VRSC -> vlotto automatically)")
-    
-    qty_raw = prompt("\nHow many tickets to buy", default="1")
-    try:
-        qty = int(qty_raw)
-        if qty <= 0:
-            raise ValueError
-    except ValueError:
-        raise SystemExit("quantity must be a positive integer")
-
-    ticket_price = 1.0
-    needed = qty * ticket_price
-    vlotto_balance = get_currency_balance(rpc, address, "vlotto")
-    deficit = max(0.0, needed - vlotto_balance)
-
-    buf = buffer_percent
-    if buf < 0:
-        buf = 0.0
-
-    deficit_with_buffer = deficit * (1.0 + buf) if deficit > 0 else 0.0
-
-    # Calculate swap requirement if needed
-    swap_opid = None
-    required_vrsc = 0.0
-    via = None
+        print(f"\n  You can afford:    {max_affordable} tickets (with current vlotto)")
+        print(f"  Available offers:  {available} tickets")
+        print(f"  (If you need more vlotto, we will swap VRSC -> vlotto automatically)")
     
-    if deficit_with_buffer > 0:
-        required_vrsc, via = get_best_exact_out_converter(rpc, "VRSC", "vlotto", deficit_with_buffer)
-
-    # Show complete purchase summary
-    print("\n" + "-" * 60)
-    print("                   ORDER SUMMARY")
-    print("-" * 60)
-    print(f"\n  Tickets to buy:    {qty}")
-    print(f"  Cost per ticket:   1.0 vlotto")
-    print(f"  Total vlotto:      {needed:.8f} vlotto")
-    print(f"\n  Your vlotto:       {vlotto_balance:.8f}")
-    
-    if deficit > 0:
-        print(f"  Deficit:           {deficit:.8f} vlotto")
-        print(f"  + {buf*100:.1f}% buffer:      {deficit_with_buffer:.8f} vlotto")
-        print(f"\n  VRSC needed:       {required_vrsc:.8f} VRSC")
-        print(f"  Your VRSC:         {vrsc_balance:.8f}")
-        print(f"  Swap via:          {via}")
-        
-        if vrsc_balance < required_vrsc:
-            print(f"\n  ⚠ WARNING: Insufficient VRSC balance!")
-            print(f"     Need {required_vrsc:.8f}, have {vrsc_balance:.8f}")
-    else:
-        print(f"\n  ✓ Sufficient vlotto balance - no swap needed")
-
-    print("\n" + "-" * 60)
-    confirm = prompt("Confirm purchase? (y/n)", default="y").lower()
-    if confirm != "y":
-        raise SystemExit("Cancelled by user.")
-
-    # Execute swap if needed
-    if deficit_with_buffer > 0:
-        print(f"\nSwapping {required_vrsc:.8f} VRSC -> vlotto...")
-        print(f"  From address: {address}")
-        swap_opid = sendcurrency_convert(rpc, address, "VRSC", "vlotto", required_vrsc, via)
-        print(f"  Swap submitted: {swap_opid}")
-
-        if swap_opid.startswith("opid-"):
-            swap_txid = wait_for_opid_success(rpc, swap_opid)
-            # Wait for at least 1 confirmation
-            wait_for_tx_confirmed(rpc, swap_txid, min_confirmations=1)
-
-        print("\n  Checking vlotto balance...")
-        vlotto_balance = wait_for_balance(rpc, address, "vlotto", needed)
-        print(f"  vlotto balance now: {vlotto_balance:.8f}")
-
-    # Buy tickets sequentially - each takeoffer is a separate tx needing its own UTXO
-    print(f"\nBuying {qty} tickets...")
-    print(f"  Using address: {address}")
-
-    purchased = []
-    errors = []
-    attempted = set()
-    bought = 0
-    last_txid = None
-
-    while bought < qty:
-        # Refresh offers to get current state
-        offers_raw = rpc.call("getoffers", ["vlotto", True])
-        offers = extract_offers_list(offers_raw)
-        offers.sort(key=lambda o: ((((o or {}).get("offer") or {}).get("offer") or {}).get("name") or ""))
+        qty_raw = prompt("\nHow many tickets to buy", default="1")
+        try:
+            qty = int(qty_raw)
+            if qty <= 0:
+                raise ValueError
+        except ValueError:
+            raise SystemExit("quantity must be a positive integer")
 
-        # Find next available offer
-        found_offer = None
-        for offer in offers:
-            txid = ((offer.get("offer") or {}).get("txid"))
-            if txid and txid not in attempted:
-                found_offer = offer
-                break
+        ticket_price = 1.0
+        needed = qty * ticket_price
+        vlotto_balance = await get_currency_balance(rpc, address, "vlotto")
+        deficit = max(0.0, needed - vlotto_balance)
 
-        if not found_offer:
-            print("  No more offers available")
-            break
+        buf = buffer_percent
+        if buf < 0:
+            buf = 0.0
 
-        offer_txid = ((found_offer.get("offer") or {}).get("txid"))
-        attempted.add(offer_txid)
+        deficit_with_buffer = deficit * (1.0 + buf) if deficit > 0 else 0.0
+
+        # Calculate swap requirement if needed
+        swap_opid = None
+        required_vrsc = 0.0
+        via = None
+    
+        if deficit_with_buffer > 0:
+            required_vrsc, via = await get_best_exact_out_converter(rpc, "VRSC", "vlotto", deficit_with_buffer)
+
+        # Show complete purchase summary
+        print("\n" + "-" * 60)
+        print("                   ORDER SUMMARY")
+        print("-" * 60)
+        print(f"\n  Tickets to buy:    {qty}")
+        print(f"  Cost per ticket:   1.0 vlotto")
+        print(f"  Total vlotto:      {needed:.8f} vlotto")
+        print(f"\n  Your vlotto:       {vlotto_balance:.8f}")
+    
+        if deficit > 0:
+            print(f"  Deficit:           {deficit:.8f} vlotto")
+            print(f"  + {buf*100:.1f}% buffer:      {deficit_with_buffer:.8f} vlotto")
+            print(f"\n  VRSC needed:       {required_vrsc:.8f} VRSC")
+            print(f"  Your VRSC:         {vrsc_balance:.8f}")
+            print(f"  Swap via:          {via}")
+        
+            if vrsc_balance < required_vrsc:
+                print(f"\n  ⚠ WARNING: Insufficient VRSC balance!")
+                print(f"     Need {required_vrsc:.8f}, have {vrsc_balance:.8f}")
+        else:
+            print(f"\n  ✓ Sufficient vlotto balance - no swap needed")
+
+        print("\n" + "-" * 60)
+        confirm = prompt("Confirm purchase? (y/n)", default="y").lower()
+        if confirm != "y":
+            raise SystemExit("Cancelled by user.")
+
+        # Execute swap if needed
+        if deficit_with_buffer > 0:
+            print(f"\nSwapping {required_vrsc:.8f} VRSC -> vlotto...")
+            print(f"  From address: {address}")
+            swap_opid = await sendcurrency_convert(rpc, address, "VRSC", "vlotto", required_vrsc, via)
+            print(f"  Swap submitted: {swap_opid}")
+
+            if swap_opid.startswith("opid-"):
+                swap_txid = await wait_for_opid_success(rpc, swap_opid)
+                # Wait for at least 1 confirmation
+                await wait_for_tx_confirmed(rpc, swap_txid, min_confirmations=1, watcher=watcher)
+
+            print("\n  Checking vlotto balance...")
+            # The swap output lands once the conversion settles, so a single
+            # check (with one retry for wallet indexing lag) usually suffices;
+            # fall back to event-driven waiting if it hasn't arrived yet.
+            vlotto_balance = await get_currency_balance(rpc, address, "vlotto")
+            if vlotto_balance < needed:
+                await sleep_ms(2000)
+                vlotto_balance = await get_currency_balance(rpc, address, "vlotto")
+            if vlotto_balance < needed:
+                vlotto_balance = await wait_for_balance(rpc, address, "vlotto", needed, watcher=watcher)
+            print(f"  vlotto balance now: {vlotto_balance:.8f}")
+
+        # Buy tickets pipelined: each takeoffer is a separate tx needing its
+        # own UTXO, but the wallet can usually fund a couple of chained
+        # takeoffers, so submit the next one while the previous confirms and
+        # cap the number awaiting confirmation with a semaphore. A "rejected"
+        # error means the UTXOs ran out - drain all in-flight confirmations
+        # and retry.
+        print(f"\nBuying {qty} tickets...")
+        print(f"  Using address: {address}")
+
+        purchased = []
+        errors = []
+        attempted = set()
+        bought = 0
+
+        in_flight = asyncio.Semaphore(2)
+        confirm_tasks: List[asyncio.Task] = []
+
+        async def _confirm_and_release(txid: str) -> None:
+            try:
+                await wait_for_tx_confirmed(rpc, txid, min_confirmations=1, watcher=watcher)
+            except Exception as e:
+                print(f"  ⚠ Confirmation issue for {txid[:16]}...: {e}")
+            finally:
+                in_flight.release()
+
+        async def _drain_confirmations() -> None:
+            if confirm_tasks:
+                await asyncio.gather(*confirm_tasks, return_exceptions=True)
+                confirm_tasks.clear()
+
+        # getoffers returns the full marketplace every time, so fetch it once
+        # and work from local state; only re-fetch when the local queue runs
+        # dry. Each entry is a (name, txid, offer) triple built in one pass so
+        # the loop never repeats the nested dict-walk per offer.
+        remaining_offers: deque = deque()
+
+        while bought < qty:
+            if not remaining_offers:
+                offers_raw = await rpc.call("getoffers", ["vlotto", True])
+                triples = []
+                for o in extract_offers_list(offers_raw):
+                    off = o.get("offer") if o else None
+                    txid = off.get("txid") if off else None
+                    if not txid or txid in attempted:
+                        continue
+                    inner = off.get("offer") or {}
+                    triples.append((inner.get("name") or "", txid, o))
+                triples.sort(key=lambda t: t[0])
+                remaining_offers = deque(triples)
+                if not remaining_offers:
+                    print("  No more offers available")
+                    break
+
+            _offer_nm, offer_txid, found_offer = remaining_offers.popleft()
+            attempted.add(offer_txid)
+
+            await in_flight.acquire()
+            try:
+                r = await take_ticket_offer(rpc, address, change_address, found_offer, returntx=dry_run)
+            except Exception as e:
+                in_flight.release()
+                err_msg = str(e)
+                if "rejected" in err_msg.lower():
+                    # UTXO not ready, wait for the in-flight txs to confirm
+                    if confirm_tasks:
+                        print(f"  ⏳ Waiting for previous txs to confirm...")
+                        await _drain_confirmations()
+                    else:
+                        print(f"  ⏳ Waiting for UTXO...")
+                        await sleep_ms(5000)
+                    # Retry this offer without re-fetching the marketplace
+                    attempted.discard(offer_txid)
+                    remaining_offers.appendleft((_offer_nm, offer_txid, found_offer))
+                else:
+                    errors.append({"offer_txid": offer_txid, "error": err_msg})
+                    print(f"  ✗ Failed: {err_msg[:50]}")
+                continue
 
-        try:
-            r = take_ticket_offer(rpc, address, change_address, found_offer, returntx=dry_run)
             result = r.get("result")
-            
+
             # Extract txid
             tx_id = None
             if isinstance(result, str) and len(result) >= 64:
                 tx_id = result.strip()[:64]
             elif isinstance(result, dict) and "txid" in result:
                 tx_id = result["txid"]
-            
+
             purchased.append(r)
             bought += 1
             print(f"  ✓ {bought}/{qty}: {r['ticket']}")
-            
-            # Wait for this tx to confirm before next purchase (UTXO availability)
-            if tx_id and bought < qty and not dry_run:
-                wait_for_tx_confirmed(rpc, tx_id, min_confirmations=1)
-            elif tx_id:
-                last_txid = tx_id
-            
-        except Exception as e:
-            err_msg = str(e)
-            if "rejected" in err_msg.lower():
-                # UTXO not ready, wait for previous tx to confirm
-                if last_txid:
-                    print(f"  ⏳ Waiting for previous tx to confirm...")
-                    wait_for_tx_confirmed(rpc, last_txid, min_confirmations=1)
-                else:
-                    print(f"  ⏳ Waiting for UTXO...")
-                    sleep_ms(5000)
-                # Retry this offer
-                attempted.discard(offer_txid)
+
+            # Track confirmation concurrently; the semaphore slot is freed
+            # once the tx confirms, throttling further submissions.
+            if tx_id and not dry_run:
+                confirm_tasks.append(asyncio.create_task(_confirm_and_release(tx_id)))
             else:
-                errors.append({"offer_txid": offer_txid, "error": err_msg})
-                print(f"  ✗ Failed: {err_msg[:50]}")
+                in_flight.release()
 
-    # Wait for last transaction to confirm if not already done
-    if last_txid and not dry_run:
-        print(f"\n  Waiting for final confirmation...")
-        wait_for_tx_confirmed(rpc, last_txid, min_confirmations=1)
+        # Wait for any remaining in-flight transactions to confirm
+        if confirm_tasks:
+            print(f"\n  Waiting for final confirmations...")
+            await _drain_confirmations()
 
-    print("\n" + "=" * 60)
-    print("                      RESULT")
-    print("=" * 60)
+        print("\n" + "=" * 60)
+        print("                      RESULT")
+        print("=" * 60)
     
-    if bought == qty:
-        print(f"\n  ✓ SUCCESS: Bought {bought}/{qty} tickets")
-    elif bought > 0:
-        print(f"\n  ⚠ PARTIAL: Bought {bought}/{qty} tickets")
-    else:
-        print(f"\n  ✗ FAILED: Could not buy any tickets")
+        if bought == qty:
+            print(f"\n  ✓ SUCCESS: Bought {bought}/{qty} tickets")
+        elif bought > 0:
+            print(f"\n  ⚠ PARTIAL: Bought {bought}/{qty} tickets")
+        else:
+            print(f"\n  ✗ FAILED: Could not buy any tickets")
     
-    if swap_opid:
-        print(f"\n  Swap txid: {swap_opid}")
-
-    if purchased:
-        print("\n  Purchased tickets:")
-        for p in purchased:
-            print(f"    - {p['ticket']}")
-
-    if errors and bought < qty:
-        print("\n  Errors (race conditions are normal):")
-        for e in errors[:5]:
-            print(f"    - {e['error'][:60]}")
-        if len(errors) > 5:
-            print(f"    ... (+{len(errors) - 5} more)")
+        if swap_opid:
+            print(f"\n  Swap txid: {swap_opid}")
+
+        if purchased:
+            print("\n  Purchased tickets:")
+            for p in purchased:
+                print(f"    - {p['ticket']}")
+
+        if errors and bought < qty:
+            print("\n  Errors (race conditions are normal):")
+            for e in errors[:5]:
+                print(f"    - {e['error'][:60]}")
+            if len(errors) > 5:
+                print(f"    ... (+{len(errors) - 5} more)")
     
-    # Show current ticket holdings
-    print("\n" + "-" * 60)
-    print("                   YOUR TICKETS")
-    print("-" * 60)
-    my_tickets = get_my_tickets(rpc, address)
-    vlotto_balance = get_currency_balance(rpc, address, "vlotto")
-    vrsc_balance = get_currency_balance(rpc, address, "VRSC")
+        # Show current ticket holdings
+        print("\n" + "-" * 60)
+        print("                   YOUR TICKETS")
+        print("-" * 60)
+        my_tickets, vlotto_balance, vrsc_balance = await asyncio.gather(
+            get_my_tickets(rpc, address),
+            get_currency_balance(rpc, address, "vlotto"),
+            get_currency_balance(rpc, address, "VRSC"),
+        )
     
-    print(f"\n  Address: {address}")
-    print(f"  VRSC balance:   {vrsc_balance:.8f}")
-    print(f"  vLotto balance: {vlotto_balance:.8f}")
-    print(f"  Tickets owned:  {len(my_tickets)}")
+        print(f"\n  Address: {address}")
+        print(f"  VRSC balance:   {vrsc_balance:.8f}")
+        print(f"  vLotto balance: {vlotto_balance:.8f}")
+        print(f"  Tickets owned:  {len(my_tickets)}")
     
-    if my_tickets:
-        print(f"    {', '.join(sorted(my_tickets))}")
+        if my_tickets:
+            print(f"    {', '.join(my_tickets)}")
     
-    print()
+        print()
     
-    # Ask if user wants to buy more
-    again = prompt("Buy more tickets? (y/n)", default="n").lower()
-    if again == "y":
-        # Restart the buy flow (recursive call or loop)
-        print("\n")
-        main()
+        # Ask if user wants to buy more
+        again = prompt("Buy more tickets? (y/n)", default="n").lower()
+        if again == "y":
+            # Restart the buy flow (recursive call or loop)
+            print("\n")
+            await main()
+    finally:
+        await watcher.stop()
+        await rpc.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())